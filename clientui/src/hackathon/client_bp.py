@@ -24,6 +24,8 @@ endpoint_id = os.environ["ENDPOINT_ID"]
 
 vertexai.init(project=project_id, location=location)
 
+model = GenerativeModel(f"projects/{project_id}/locations/{location}/endpoints/{endpoint_id}")
+
 initial_prompt_template = """
 Your name is Homer. You are a chatbot which is part of the HomeIE solution which exists to provide You are a Housing and financial expert for Ireland.  Your role is to interpret complex Housing, financial and statistical data, offer personalized advice, and evaluate users lifestage decisions using statistical methods to gain insights across different financial areas.
 Accuracy is the top priority. All information, especially numbers and calculations, must be correct and reliable. Always double-check for errors before giving a response. The way you respond should change based on what the user needs. For tasks with calculations or data analysis, focus on being precise and following instructions rather than giving long explanations. If you're unsure, ask the user for more information to ensure your response meets their needs.
@@ -44,6 +46,8 @@ Here is some of my information about this session:
 * My total savings are {savings} Euro
 """
 
+tax_years = (2023, 2022, 2021, 2020)
+
 
 @client_bp.route("/", methods=['GET'])
 def client_root():
@@ -53,25 +57,24 @@ def client_root():
 @client_bp.route("/api/chat", methods=['POST'])
 def send_prompt():
     data = request.json
-    print("Got %s" % (data,))
-
-    model = GenerativeModel(f"projects/{project_id}/locations/{location}/endpoints/{endpoint_id}")
+    print(f"Got {data}")
 
+    user_info = data['user_info']
     initial_prompt = initial_prompt_template.format(
-        location=data['user_info']['location'],
-        income=data['user_info']['income'],
-        savings=data['user_info']['savings'])
-    initial_prompt += '\n* I paid {tax_2023} Euro tax in 2023' if data['user_info']['tax_2023'] else ''
-    initial_prompt += '\n* I paid {tax_2022} Euro tax in 2022' if data['user_info']['tax_2022'] else ''
-    initial_prompt += '\n* I paid {tax_2021} Euro tax in 2021' if data['user_info']['tax_2021'] else ''
-    initial_prompt += '\n* I paid {tax_2020} Euro tax in 2020' if data['user_info']['tax_2020'] else ''
+        location=user_info['location'],
+        income=user_info['income'],
+        savings=user_info['savings'])
+    for year in tax_years:
+        tax = user_info[f'tax_{year}']
+        if tax:
+            initial_prompt += f'\n* I paid {tax} Euro tax in {year}'
     prompt = [initial_prompt]
 
     if data['history']:
-        prompt += [p['text'] for p in data['history']]
+        prompt.extend(p['text'] for p in data['history'])
 
     if data['prompt']:
-        prompt += [data['prompt']]
+        prompt.append(data['prompt'])
 
     response = model.generate_content(prompt)
 